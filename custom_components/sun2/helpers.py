@@ -2,16 +2,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
-from datetime import date, datetime, time, timedelta, tzinfo
+from datetime import date, datetime, timedelta, tzinfo
 from functools import (  # pylint: disable=hass-deprecated-import
     cached_property,
     lru_cache,
 )
 import logging
 from math import copysign, fabs
-from typing import Any, Self, cast, overload
+from typing import TYPE_CHECKING, Any, Self, cast, overload
 
 from astral import LocationInfo
 from astral.location import Location
@@ -43,6 +44,7 @@ except ImportError:
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.translation import async_get_translations
 from homeassistant.util import dt as dt_util
 
@@ -56,14 +58,23 @@ from .const import (
     CONF_OBS_ELV,
     DOMAIN,
     ONE_DAY,
+    ONE_SEC,
     SIG_ASTRAL_DATA_UPDATED,
     SIG_HA_LOC_UPDATED,
 )
 
+if TYPE_CHECKING:
+    from .sensor import CurveParameters
+
 _LOGGER = logging.getLogger(__name__)
 
 Num = float | int
 
+# Results for dates this much older than the latest one asked for are discarded.
+_DATE_EVENTS_AGE = timedelta(days=3)
+# How many point in time astral event results to keep.
+_DTTM_EVENTS_MAX = 512
+
 
 @dataclass(frozen=True)
 class LocParams:
@@ -98,12 +109,29 @@ class LocParams:
             return None
 
 
+@dataclass(slots=True)
+class LocCache:
+    """Results shared by all entities that use the same location."""
+
+    # Date based astral event results, by date.
+    date_events: dict[date, dict[tuple[Any, ...], Any]] = field(default_factory=dict)
+    # Most recently used point in time astral event results.
+    dttm_events: OrderedDict[tuple[Any, ...], Any] = field(
+        default_factory=OrderedDict
+    )
+    # Elevation curve parameters, with the date they were determined for.
+    curve_params: list[tuple[date, CurveParameters]] = field(default_factory=list)
+
+
 @dataclass(frozen=True)
 class LocData:
     """Location data."""
 
     loc: Location
     tzi: tzinfo | None
+    cache: LocCache = field(
+        default_factory=LocCache, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_loc_params(cls, lp: LocParams) -> Self:
@@ -234,6 +262,9 @@ class Sun2Data:
     translations: dict[str, str] = field(default_factory=dict)
     language: str | None = None
     config_data: dict[str, ConfigData] = field(default_factory=dict)
+    midnight_trackers: dict[tzinfo | None, MidnightTracker] = field(
+        default_factory=dict
+    )
 
 
 async def init_sun2_data(hass: HomeAssistant) -> Sun2Data:
@@ -250,11 +281,19 @@ def sun2_data(hass: HomeAssistant) -> Sun2Data:
 
 
 def hours_to_hms(hours: Num | None) -> str | None:
-    """Convert hours to HH:MM:SS string."""
-    try:
-        return str(timedelta(seconds=int(cast(Num, hours) * 3600)))
-    except TypeError:
+    """Convert hours to HH:MM:SS string.
+
+    Same format as str(timedelta), but without creating a timedelta.
+    """
+    if hours is None:
         return None
+    mins, secs = divmod(int(hours * 3600), 60)
+    hrs, mins = divmod(mins, 60)
+    days, hrs = divmod(hrs, 24)
+    hms = f"{hrs}:{mins:02}:{secs:02}"
+    if days:
+        return f"{days} day{'' if abs(days) == 1 else 's'}, {hms}"
+    return hms
 
 
 _TRANS_PREFIX = f"component.{DOMAIN}.selector.misc.options"
@@ -297,14 +336,74 @@ def sun2_dev_info(hass: HomeAssistant, entry: ConfigEntry) -> DeviceInfo:
 
 def nearest_second(dttm: datetime) -> datetime:
     """Round dttm to nearest second."""
-    return dttm.replace(microsecond=0) + timedelta(
-        seconds=0 if dttm.microsecond < 500000 else 1
-    )
+    if not (usec := dttm.microsecond):
+        return dttm
+    if usec < 500000:
+        return dttm.replace(microsecond=0)
+    return dttm.replace(microsecond=0) + ONE_SEC
 
 
 def next_midnight(dttm: datetime) -> datetime:
     """Return next midnight in same time zone."""
-    return datetime.combine(dttm.date() + ONE_DAY, time(), dttm.tzinfo)
+    nxt_date = dttm.date() + ONE_DAY
+    return datetime(nxt_date.year, nxt_date.month, nxt_date.day, tzinfo=dttm.tzinfo)
+
+
+class MidnightTracker:
+    """Call listeners at every midnight in a time zone using a single timer."""
+
+    _unsub: CALLBACK_TYPE | None = None
+
+    def __init__(self, hass: HomeAssistant, tzi: tzinfo | None) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._tzi = tzi
+        self._listeners: list[Callable[[datetime], None]] = []
+
+    @callback
+    def async_add_listener(self, action: Callable[[datetime], None]) -> CALLBACK_TYPE:
+        """Add listener & return function that removes it."""
+        self._listeners.append(action)
+        if not self._unsub:
+            self._schedule(dt_util.utcnow())
+
+        @callback
+        def remove_listener() -> None:
+            """Remove listener."""
+            self._listeners.remove(action)
+            if not self._listeners and self._unsub:
+                self._unsub()
+                self._unsub = None
+
+        return remove_listener
+
+    def _schedule(self, now: datetime) -> None:
+        """Schedule timer for next midnight."""
+        self._unsub = async_track_point_in_utc_time(
+            self._hass, self._midnight, next_midnight(now.astimezone(self._tzi))
+        )
+
+    @callback
+    def _midnight(self, now: datetime) -> None:
+        """Handle midnight."""
+        self._schedule(now)
+        for action in self._listeners[:]:
+            action(now)
+
+
+@callback
+def async_track_midnight(
+    hass: HomeAssistant, tzi: tzinfo | None, action: Callable[[datetime], None]
+) -> CALLBACK_TYPE:
+    """Call action at every midnight in given time zone.
+
+    All listeners for the same time zone share one timer.
+    Returns function that removes listener.
+    """
+    trackers = sun2_data(hass).midnight_trackers
+    if (tracker := trackers.get(tzi)) is None:
+        tracker = trackers[tzi] = MidnightTracker(hass, tzi)
+    return tracker.async_add_listener(action)
 
 
 @dataclass
@@ -401,12 +500,69 @@ class Sun2Entity(Entity):
         /,
         **kwargs: Any,
     ) -> Any:
-        """Return astral event result."""
+        """Return astral event result.
+
+        Results are shared by all entities that use the same location, since many of
+        them ask for the same events. Results for a date (e.g., sunrise) are kept
+        until the date is no longer needed. A limited number of the most recently used
+        results for a point in time (e.g., solar elevation) are kept.
+
+        For sunrise, sunset, dawn & dusk, observer_elevation may be passed to use
+        instead of the configured observer elevation.
+        """
         if not event:
             event = self._event
+        # Only include solar depression & observer elevation in the key for events
+        # that depend on them so other results (e.g., solar noon, time_at_elevation)
+        # can be shared by entities with different settings.
+        depression: Num | str | None = None
+        if event in ("sunrise", "dawn"):
+            kwargs.setdefault("observer_elevation", self._astral_data.obs_elvs.east)
+        elif event in ("sunset", "dusk"):
+            kwargs.setdefault("observer_elevation", self._astral_data.obs_elvs.west)
+        if event in ("dawn", "dusk"):
+            depression = getattr(self, "_solar_depression", None)
+        key = (event, local, depression, *sorted(kwargs.items()))
+        loc_cache = self._astral_data.loc_data.cache
+
+        if isinstance(date_or_dttm, datetime):
+            lru = loc_cache.dttm_events
+            key = (date_or_dttm, *key)
+            try:
+                lru.move_to_end(key)
+                return lru[key]
+            except KeyError:
+                result = lru[key] = self._calc_astral_event(
+                    date_or_dttm, event, local, depression, kwargs
+                )
+                if len(lru) > _DTTM_EVENTS_MAX:
+                    lru.popitem(last=False)
+                return result
+
+        cache = loc_cache.date_events
+        if (results := cache.get(date_or_dttm)) is None:
+            # Forget results for dates that are no longer needed.
+            for old_date in [d for d in cache if d < date_or_dttm - _DATE_EVENTS_AGE]:
+                del cache[old_date]
+            results = cache[date_or_dttm] = {}
+        try:
+            return results[key]
+        except KeyError:
+            result = results[key] = self._calc_astral_event(
+                date_or_dttm, event, local, depression, kwargs
+            )
+            return result
+
+    def _calc_astral_event(
+        self,
+        date_or_dttm: date | datetime,
+        event: str,
+        local: bool,
+        depression: Num | str | None,
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Calculate astral event result."""
         loc = self._astral_data.loc_data.loc
-        if hasattr(self, "_solar_depression"):
-            loc.solar_depression = self._solar_depression
 
         try:
             if event in ("solar_midnight", "solar_noon"):
@@ -417,10 +573,12 @@ class Sun2Entity(Entity):
                     kwargs["elevation"], date_or_dttm, kwargs["direction"], local
                 )
 
-            if event in ("sunrise", "dawn"):
-                kwargs = {"observer_elevation": self._astral_data.obs_elvs.east}
-            elif event in ("sunset", "dusk"):
-                kwargs = {"observer_elevation": self._astral_data.obs_elvs.west}
+            if event in ("sunrise", "dawn", "sunset", "dusk"):
+                # Location is shared by entities with different depressions, so set
+                # it only for, and right before, the events that use it.
+                if depression is not None:
+                    loc.solar_depression = depression
+                kwargs = {"observer_elevation": kwargs["observer_elevation"]}
             else:
                 kwargs = {}
             if event not in ("solar_azimuth", "solar_elevation"):
@@ -2,12 +2,16 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from collections.abc import Iterable, Mapping, Sequence
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
 from contextlib import suppress
-from dataclasses import dataclass
-from datetime import date, datetime, time, timedelta
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, time, timedelta
 from itertools import chain
+import logging
 from math import ceil, floor
+from operator import ge, gt
 from typing import Any, Generic, TypeVar, cast
 
 from astral import SunDirection
@@ -69,9 +73,9 @@ from .helpers import (
     Sun2Entity,
     Sun2EntityParams,
     Sun2EntrySetup,
+    async_track_midnight,
     hours_to_hms,
     nearest_second,
-    next_midnight,
     translate,
 )
 
@@ -87,6 +91,15 @@ _ENABLED_SENSORS = [
 ]
 _SOLAR_DEPRESSIONS = ("astronomical", "civil", "nautical")
 _DELTA = timedelta(minutes=5)
+_ELEV_STEPS = 1 / ELEV_STEP
+_SUNSET_ELEV_HI = SUNSET_ELEV + MAX_ERR_ELEV
+_SUNSET_ELEV_LO = SUNSET_ELEV - MAX_ERR_ELEV
+# Sun direction, indexed by CurveParameters.rising.
+_DIRECTIONS = (SunDirection.SETTING, SunDirection.RISING)
+# Elevations where icon changes, and icons for elevations below, between & above.
+_ICON_ELEVS = (-18, SUNSET_ELEV)
+_RISING_ICONS = ("mdi:weather-night", "mdi:weather-sunset-up", "mdi:weather-sunny")
+_FALLING_ICONS = ("mdi:weather-night", "mdi:weather-sunset-down", "mdi:weather-sunny")
 
 
 _T = TypeVar("_T")
@@ -151,6 +164,7 @@ class Sun2SensorEntity(Sun2Entity, SensorEntity, Generic[_T]):
     _yesterday: _T | None = None
     _today: _T | None = None
     _tomorrow: _T | None = None
+    _upd_date: date | None = None
 
     @abstractmethod
     def __init__(
@@ -174,15 +188,6 @@ class Sun2SensorEntity(Sun2Entity, SensorEntity, Generic[_T]):
             self._solar_depression = default_solar_depression
             self._event = key
 
-    @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
-        """Return entity specific state attributes."""
-        return {
-            ATTR_YESTERDAY: self._yesterday,
-            ATTR_TODAY: self._today,
-            ATTR_TOMORROW: self._tomorrow,
-        }
-
     def _setup_fixed_updating(self) -> None:
         """Set up fixed updating."""
         # Default behavior is to update every midnight.
@@ -194,25 +199,45 @@ class Sun2SensorEntity(Sun2Entity, SensorEntity, Generic[_T]):
         @callback
         def async_schedule_update_at_midnight(now: datetime) -> None:
             """Schedule an update at midnight."""
-            next_midn = next_midnight(self._as_tz(now))
-            self._unsub_update = async_track_point_in_utc_time(
-                self.hass, async_schedule_update_at_midnight, next_midn
-            )
             self.async_schedule_update_ha_state(True)
 
-        next_midn = next_midnight(self._as_tz(dt_util.utcnow()))
-        self._unsub_update = async_track_point_in_utc_time(
-            self.hass, async_schedule_update_at_midnight, next_midn
+        self._unsub_update = async_track_midnight(
+            self.hass,
+            self._astral_data.loc_data.tzi,
+            async_schedule_update_at_midnight,
         )
 
+    def _update_astral_data(self, astral_data: AstralData) -> None:
+        """Update astral data."""
+        self._upd_date = None
+        super()._update_astral_data(astral_data)
+
     def _update(self, cur_dttm: datetime) -> None:
         """Update state."""
+        # Values only depend on the date (and astral data, which resets _upd_date), so
+        # there is nothing to do if they've already been determined for this date.
         cur_date = self._as_tz(cur_dttm).date()
+        if cur_date == self._upd_date:
+            return
+        self._upd_date = cur_date
         self._yesterday = cast(_T | None, self._astral_event(cur_date - ONE_DAY))
         self._attr_native_value = self._today = cast(
             _T | None, self._astral_event(cur_date)
         )
         self._tomorrow = cast(_T | None, self._astral_event(cur_date + ONE_DAY))
+        self._update_attrs()
+
+    def _update_attrs(self) -> None:
+        """Update attributes from yesterday, today & tomorrow values.
+
+        Attributes only change when state is updated, so build them once here
+        instead of every time they are read.
+        """
+        self._attr_extra_state_attributes = {
+            ATTR_YESTERDAY: self._yesterday,
+            ATTR_TODAY: self._today,
+            ATTR_TOMORROW: self._tomorrow,
+        }
 
 
 class Sun2ElevationAtTimeSensor(Sun2SensorEntity[float]):
@@ -241,13 +266,6 @@ class Sun2ElevationAtTimeSensor(Sun2SensorEntity[float]):
         super().__init__(sun2_entity_params, entity_description, name=name)
         self._event = "solar_elevation"
 
-    @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
-        """Return entity specific state attributes."""
-        if isinstance(self._at_time, datetime):
-            return None
-        return super().extra_state_attributes
-
     def _setup_fixed_updating(self) -> None:
         """Set up fixed updating."""
         super()._setup_fixed_updating()
@@ -319,6 +337,7 @@ class Sun2ElevationAtTimeSensor(Sun2SensorEntity[float]):
             self._yesterday = None
             self._attr_native_value = self._today = None
             self._tomorrow = None
+            self._update_attrs()
             return
         if isinstance(self._at_time, datetime):
             dttm = self._at_time
@@ -326,10 +345,12 @@ class Sun2ElevationAtTimeSensor(Sun2SensorEntity[float]):
             dttm = datetime.combine(cur_dttm.date(), self._at_time)
         self._attr_native_value = cast(float | None, self._astral_event(dttm))
         if isinstance(self._at_time, datetime):
+            self._attr_extra_state_attributes = {}
             return
         self._yesterday = cast(float | None, self._astral_event(dttm - ONE_DAY))
         self._today = self._attr_native_value
         self._tomorrow = cast(float | None, self._astral_event(dttm + ONE_DAY))
+        self._update_attrs()
 
 
 class Sun2PointInTimeSensor(Sun2SensorEntity[datetime | str]):
@@ -400,19 +421,12 @@ class Sun2PeriodOfTimeSensor(Sun2SensorEntity[float]):
             state_class=SensorStateClass.MEASUREMENT,
         )
         super().__init__(sun2_entity_params, entity_description, SUN_APPARENT_RADIUS)
-
-    @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
-        """Return entity specific state attributes."""
-        data = dict(super().extra_state_attributes or {})
-        data.update(
-            {
-                ATTR_YESTERDAY_HMS: hours_to_hms(data[ATTR_YESTERDAY]),
-                ATTR_TODAY_HMS: hours_to_hms(data[ATTR_TODAY]),
-                ATTR_TOMORROW_HMS: hours_to_hms(data[ATTR_TOMORROW]),
-            }
-        )
-        return data
+        # Period starts & ends with these events, where the end event is on the date
+        # offset from the start event's date.
+        if self._event == "daylight":
+            self._start_end = ("dawn", "dusk", timedelta())
+        else:
+            self._start_end = ("dusk", "dawn", ONE_DAY)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -438,6 +452,17 @@ class Sun2PeriodOfTimeSensor(Sun2SensorEntity[float]):
             self.entity_id, SENSOR_DOMAIN, sensor_options or None
         )
 
+    def _update_attrs(self) -> None:
+        """Update attributes from yesterday, today & tomorrow values."""
+        super()._update_attrs()
+        self._attr_extra_state_attributes.update(
+            {
+                ATTR_YESTERDAY_HMS: hours_to_hms(self._yesterday),
+                ATTR_TODAY_HMS: hours_to_hms(self._today),
+                ATTR_TOMORROW_HMS: hours_to_hms(self._tomorrow),
+            }
+        )
+
     def _astral_event(
         self,
         date_or_dttm: date | datetime,
@@ -447,15 +472,12 @@ class Sun2PeriodOfTimeSensor(Sun2SensorEntity[float]):
         **kwargs: Any,
     ) -> float | None:
         """Return astral event result."""
-        start: datetime | None
-        end: datetime | None
-        if self._event == "daylight":
-            start = super()._astral_event(date_or_dttm, "dawn", False)
-            end = super()._astral_event(date_or_dttm, "dusk", False)
-        else:
-            start = super()._astral_event(date_or_dttm, "dusk", False)
-            end = super()._astral_event(date_or_dttm + ONE_DAY, "dawn", False)
-        if not start or not end:
+        start_event, end_event, end_offset = self._start_end
+        start: datetime | None = super()._astral_event(date_or_dttm, start_event, False)
+        end: datetime | None = super()._astral_event(
+            date_or_dttm + end_offset, end_event, False
+        )
+        if start is None or end is None:
             return None
         return (end - start).total_seconds() / 3600
 
@@ -489,10 +511,13 @@ class Sun2MinMaxElevationSensor(Sun2SensorEntity[float]):
         **kwargs: Any,
     ) -> float | None:
         """Return astral event result."""
+        # Time of solar noon/midnight is only used to get elevation, so no need to
+        # convert it to local time zone.
         return cast(
             float | None,
             super()._astral_event(
-                cast(datetime, super()._astral_event(date_or_dttm)), "solar_elevation"
+                cast(datetime, super()._astral_event(date_or_dttm, None, False)),
+                "solar_elevation",
             ),
         )
 
@@ -525,20 +550,18 @@ class Sun2SunriseSunsetAzimuthSensor(Sun2SensorEntity[float]):
     ) -> float | None:
         """Return astral event result."""
         # Get sunrise or sunset time.
-        # Don't use parent method because observer elevation should not be used
-        # because there is no way to know if currently configured observer elevation
-        # was valid yesterday or will be valid tomorrow since it is very possible the
-        # state of this sensor will be used to automatically change the observer
-        # configuration throughout the year. This also avoids a potentially infinite
-        # feedback loop.
-        try:
-            dttm = getattr(self._astral_data.loc_data.loc, self._method)(date_or_dttm)
-        except (TypeError, ValueError):
+        # Don't use configured observer elevation because there is no way to know if
+        # currently configured observer elevation was valid yesterday or will be valid
+        # tomorrow since it is very possible the state of this sensor will be used to
+        # automatically change the observer configuration throughout the year. This
+        # also avoids a potentially infinite feedback loop.
+        dttm = super()._astral_event(date_or_dttm, self._method, observer_elevation=0)
+        if dttm is None:
             return None
         return cast(float | None, super()._astral_event(dttm))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CurveParameters:
     """Parameters that describe current portion of elevation curve.
 
@@ -546,7 +569,8 @@ class CurveParameters:
     midnight and solar noon, such that tl_dttm <= cur_dttm < tr_dttm. rising is True if
     tr_elev > tl_elev (i.e., tL represents a solar midnight and tR represents a solar
     noon.) mid_date is the date of the midpoint between tL & tR. nxt_noon is the solar
-    noon for tomorrow (i.e., cur_date + 1.)
+    noon for tomorrow (i.e., cur_date + 1.) nadir_dttm is half a day before tR when
+    rising, or half a day before nxt_noon when falling.
     """
 
     tl_dttm: datetime
@@ -556,6 +580,7 @@ class CurveParameters:
     mid_date: date
     nxt_noon: datetime
     rising: bool
+    nadir_dttm: datetime
 
 
 class Sun2CPSensorEntity(Sun2SensorEntity[_T]):
@@ -576,13 +601,6 @@ class Sun2CPSensorEntity(Sun2SensorEntity[_T]):
         )
         self._event = "solar_elevation"
 
-    @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
-        """Return entity specific state attributes."""
-        if hasattr(self, "_attr_extra_state_attributes"):
-            return self._attr_extra_state_attributes
-        return None
-
     def _update_astral_data(self, astral_data: AstralData) -> None:
         """Update astral data."""
         self._cp = None
@@ -595,21 +613,11 @@ class Sun2CPSensorEntity(Sun2SensorEntity[_T]):
         """Return attributes at elevation."""
         assert self._cp
 
+        # When rising, an elevation equal to a threshold gets the higher icon.
+        # When falling, it gets the lower icon.
         if self._cp.rising:
-            if elev < -18:
-                icon = "mdi:weather-night"
-            elif elev < SUNSET_ELEV:
-                icon = "mdi:weather-sunset-up"
-            else:
-                icon = "mdi:weather-sunny"
-        else:  # noqa: PLR5501
-            if elev > SUNSET_ELEV:
-                icon = "mdi:weather-sunny"
-            elif elev > -18:
-                icon = "mdi:weather-sunset-down"
-            else:
-                icon = "mdi:weather-night"
-        return {ATTR_ICON: icon}
+            return {ATTR_ICON: _RISING_ICONS[bisect_right(_ICON_ELEVS, elev)]}
+        return {ATTR_ICON: _FALLING_ICONS[bisect_left(_ICON_ELEVS, elev)]}
 
     def _set_attrs(self, attrs: dict[str, Any], nxt_chg: datetime) -> None:
         """Set attributes."""
@@ -618,9 +626,29 @@ class Sun2CPSensorEntity(Sun2SensorEntity[_T]):
         self._attr_extra_state_attributes = attrs
 
     def _get_curve_params(self, cur_dttm: datetime, cur_elev: Num) -> CurveParameters:
-        """Calculate elevation curve parameters."""
-        cur_date = self._as_tz(cur_dttm).date()
+        """Get elevation curve parameters.
 
+        Parameters only depend on location & current time, so they are shared with
+        all entities that use the same location.
+        """
+        cur_date = self._as_tz(cur_dttm).date()
+        shared_cps = self._astral_data.loc_data.cache.curve_params
+        for cp_date, cp in shared_cps:
+            if cp_date == cur_date and cp.tl_dttm <= cur_dttm < cp.tr_dttm:
+                return cp
+
+        cp = self._calc_curve_params(cur_dttm, cur_date, cur_elev)
+        # Drop parameters for portions of the curve that have passed.
+        shared_cps[:] = [
+            date_cp for date_cp in shared_cps if date_cp[1].tr_dttm > cur_dttm
+        ]
+        shared_cps.append((cur_date, cp))
+        return cp
+
+    def _calc_curve_params(
+        self, cur_dttm: datetime, cur_date: date, cur_elev: Num
+    ) -> CurveParameters:
+        """Calculate elevation curve parameters."""
         # Find the highest and lowest points on the elevation curve that encompass
         # current time, where it is ok for the current time to be the same as the
         # first of these two points.
@@ -655,21 +683,23 @@ class Sun2CPSensorEntity(Sun2SensorEntity[_T]):
         tr_elev = cast(float, self._astral_event(tr_dttm))
         rising = tr_elev > tl_elev
 
-        LOGGER.debug(
-            "%s: tL = %s/%0.3f, cur = %s/%0.3f, tR = %s/%0.3f, rising = %s",
-            self.name,
-            self._as_tz(tl_dttm),
-            tl_elev,
-            self._as_tz(cur_dttm),
-            cur_elev,
-            self._as_tz(tr_dttm),
-            tr_elev,
-            rising,
-        )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "%s: tL = %s/%0.3f, cur = %s/%0.3f, tR = %s/%0.3f, rising = %s",
+                self.name,
+                self._as_tz(tl_dttm),
+                tl_elev,
+                self._as_tz(cur_dttm),
+                cur_elev,
+                self._as_tz(tr_dttm),
+                tr_elev,
+                rising,
+            )
 
         mid_date = self._as_tz(tl_dttm + (tr_dttm - tl_dttm) / 2).date()
+        nadir_dttm = (tr_dttm if rising else nxt_noon) - HALF_DAY
         return CurveParameters(
-            tl_dttm, tl_elev, tr_dttm, tr_elev, mid_date, nxt_noon, rising
+            tl_dttm, tl_elev, tr_dttm, tr_elev, mid_date, nxt_noon, rising, nadir_dttm
         )
 
     def _get_dttm_at_elev(
@@ -678,50 +708,69 @@ class Sun2CPSensorEntity(Sun2SensorEntity[_T]):
         """Get datetime at elevation."""
         assert self._cp
 
-        msg_base = f"{self.name}: trg = {elev:+7.3f}: "
-        t0_elev = cast(float, self._astral_event(t0_dttm))
-        t1_elev = cast(float, self._astral_event(t1_dttm))
+        # Only build debug messages if they will be used.
+        msg_base = msg = ""
+        if debug := LOGGER.isEnabledFor(logging.DEBUG):
+            msg_base = f"{self.name}: trg = {elev:+7.3f}: "
+        # Do arithmetic on POSIX timestamps, which is much cheaper than datetime &
+        # timedelta arithmetic, and only create datetime objects as needed for astral.
+        tl_ts = self._cp.tl_dttm.timestamp()
+        tr_ts = self._cp.tr_dttm.timestamp()
+        t0_ts = t0_dttm.timestamp()
+        t1_ts = t1_dttm.timestamp()
+        # Bind bound method to local since it's called on every iteration.
+        astral_event = self._astral_event
+        t0_elev = cast(float, astral_event(t0_dttm))
+        t1_elev = cast(float, astral_event(t1_dttm))
         est_elev = elev + 1.5 * max_err
         est = 0
+        kept: int | None = None
         while abs(est_elev - elev) >= max_err:
             est += 1
-            msg = (
-                msg_base
-                + f"t0 = {self._as_tz(t0_dttm)}/{t0_elev:+7.3f}, t1 = {self._as_tz(t1_dttm)}/{t1_elev:+7.3f} ->"
-            )
-            try:
-                est_dttm = nearest_second(
-                    t0_dttm
-                    + (t1_dttm - t0_dttm) * ((elev - t0_elev) / (t1_elev - t0_elev))
+            if debug:
+                msg = (
+                    msg_base
+                    + f"t0 = {self._as_tz(t0_dttm)}/{t0_elev:+7.3f}, t1 = {self._as_tz(t1_dttm)}/{t1_elev:+7.3f} ->"
                 )
-            except ZeroDivisionError:
-                LOGGER.debug("%s ZeroDivisionError", msg)
+            if (d_elev := t1_elev - t0_elev) == 0:
+                LOGGER.debug("%s equal elevations at bracket ends", msg)
                 return None
-            if est_dttm < self._cp.tl_dttm or est_dttm > self._cp.tr_dttm:
+            # Round to nearest second since astral package ignores microseconds.
+            est_ts = floor(t0_ts + (t1_ts - t0_ts) * ((elev - t0_elev) / d_elev) + 0.5)
+            if est_ts < tl_ts or est_ts > tr_ts:
                 LOGGER.debug("%s outside range", msg)
                 return None
-            est_elev = cast(float, self._astral_event(est_dttm))
-            LOGGER.debug(
-                "%s est = %s/%+7.3f[%+7.3f/%2i]",
-                msg,
-                self._as_tz(est_dttm),
-                est_elev,
-                est_elev - elev,
-                est,
-            )
-            if est_dttm in (t0_dttm, t1_dttm):
+            est_dttm = datetime.fromtimestamp(est_ts, UTC)
+            est_elev = cast(float, astral_event(est_dttm))
+            if debug:
+                LOGGER.debug(
+                    "%s est = %s/%+7.3f[%+7.3f/%2i]",
+                    msg,
+                    self._as_tz(est_dttm),
+                    est_elev,
+                    est_elev - elev,
+                    est,
+                )
+            if est_ts in (t0_ts, t1_ts):
                 break
-            if est_dttm > t1_dttm:
-                t0_dttm = t1_dttm
-                t0_elev = t1_elev
-                t1_dttm = est_dttm
-                t1_elev = est_elev
+            # When the same end point is kept twice in a row while the target is
+            # bracketed, move its elevation halfway toward the target (Illinois
+            # method.) Otherwise, since the elevation curve is not linear, one end
+            # point can get stuck and convergence slows to a crawl.
+            if est_ts > t1_ts:
+                t0_dttm, t0_ts, t0_elev = t1_dttm, t1_ts, t1_elev
+                t1_dttm, t1_ts, t1_elev = est_dttm, est_ts, est_elev
+                kept = None
             elif t0_elev < elev < est_elev or t0_elev > elev > est_elev:
-                t1_dttm = est_dttm
-                t1_elev = est_elev
+                t1_dttm, t1_ts, t1_elev = est_dttm, est_ts, est_elev
+                if kept == 0:
+                    t0_elev = elev + (t0_elev - elev) / 2
+                kept = 0
             else:
-                t0_dttm = est_dttm
-                t0_elev = est_elev
+                t0_dttm, t0_ts, t0_elev = est_dttm, est_ts, est_elev
+                if kept == 1 and (t1_elev - elev) * (est_elev - elev) < 0:
+                    t1_elev = elev + (t1_elev - elev) / 2
+                kept = 1
         return est_dttm
 
 
@@ -752,33 +801,36 @@ class Sun2ElevationSensor(Sun2CPSensorEntity[float]):
         self._attr_native_value = rnd_elev = round(cur_elev, 1)
         LOGGER.debug("%s: Raw elevation = %f -> %s", self.name, cur_elev, rnd_elev)
 
-        if not self._cp or cur_dttm >= self._cp.tr_dttm:
+        if not (cp := self._cp) or cur_dttm >= cp.tr_dttm:
             self._prv_dttm = None
-            self._cp = self._get_curve_params(cur_dttm, cur_elev)
+            self._cp = cp = self._get_curve_params(cur_dttm, cur_elev)
 
+        nxt_dttm = None
         if self._prv_dttm:
             # Extrapolate based on previous point and current point to find next point.
             # But if that crosses sunrise/sunset elevation, then make next point the
             # sunrise/sunset elevation so icon updates at the right time.
-            if self._cp.rising:
-                elev = floor((rnd_elev + ELEV_STEP) / ELEV_STEP) * ELEV_STEP
-                if rnd_elev < SUNSET_ELEV and elev > SUNSET_ELEV + MAX_ERR_ELEV:
-                    elev = SUNSET_ELEV + MAX_ERR_ELEV
+            # Don't bother if sun won't get to next point before end of this portion of
+            # the curve (e.g., near solar noon/midnight, or during polar day/night.)
+            if cp.rising:
+                elev = (floor(rnd_elev * _ELEV_STEPS) + 1) * ELEV_STEP
+                if rnd_elev < SUNSET_ELEV and elev > _SUNSET_ELEV_HI:
+                    elev = _SUNSET_ELEV_HI
+                reachable = elev <= cp.tr_elev
             else:
-                elev = ceil((rnd_elev - ELEV_STEP) / ELEV_STEP) * ELEV_STEP
-                if rnd_elev > SUNSET_ELEV and elev < SUNSET_ELEV - MAX_ERR_ELEV:
-                    elev = SUNSET_ELEV - MAX_ERR_ELEV
-            nxt_dttm = self._get_dttm_at_elev(
-                self._prv_dttm, cur_dttm, elev, MAX_ERR_ELEV
-            )
-        else:
-            nxt_dttm = None
+                elev = (ceil(rnd_elev * _ELEV_STEPS) - 1) * ELEV_STEP
+                if rnd_elev > SUNSET_ELEV and elev < _SUNSET_ELEV_LO:
+                    elev = _SUNSET_ELEV_LO
+                reachable = elev >= cp.tr_elev
+            if reachable:
+                nxt_dttm = self._get_dttm_at_elev(
+                    self._prv_dttm, cur_dttm, elev, MAX_ERR_ELEV
+                )
 
         if not nxt_dttm:
-            if self._cp.tr_dttm - _DELTA <= cur_dttm < self._cp.tr_dttm:
-                nxt_dttm = self._cp.tr_dttm
-            else:
-                nxt_dttm = cur_dttm + _DELTA
+            # Update again after _DELTA, but not past the end of this portion of the
+            # curve.
+            nxt_dttm = min(cur_dttm + _DELTA, cp.tr_dttm)
 
         self._set_attrs(self._attrs_at_elev(cur_elev), nxt_dttm)
 
@@ -795,21 +847,52 @@ class Sun2ElevationSensor(Sun2CPSensorEntity[float]):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PhaseData:
     """Unique data to each subclass that is determined once at initialization."""
 
-    rising_elevs: Sequence[Num]
-    rising_states: Sequence[tuple[Num, str]]
-    falling_elevs: Sequence[Num]
-    falling_states: Sequence[tuple[Num, str]]
+    rising_elevs: tuple[Num, ...]
+    rising_states: tuple[tuple[Num, str], ...]
+    falling_elevs: tuple[Num, ...]
+    falling_states: tuple[tuple[Num, str], ...]
+    rising_keys: tuple[Num, ...] = field(init=False)
+    rising_vals: tuple[str, ...] = field(init=False)
+    falling_keys: tuple[Num, ...] = field(init=False)
+    falling_vals: tuple[str, ...] = field(init=False)
+    falling_elev_keys: tuple[Num, ...] = field(init=False)
+    options: tuple[str, ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Derive data from phase tables.
+
+        Split states into elevation & state tuples so they can be used with bisect.
+        Falling elevations are descending, so negate them to make them ascending.
+        Also determine the unique states, in order, for the sensor's options.
+        """
+        object.__setattr__(
+            self, "rising_keys", tuple(state[0] for state in self.rising_states)
+        )
+        object.__setattr__(
+            self, "rising_vals", tuple(state[1] for state in self.rising_states)
+        )
+        object.__setattr__(
+            self, "falling_keys", tuple(-state[0] for state in self.falling_states)
+        )
+        object.__setattr__(
+            self, "falling_vals", tuple(state[1] for state in self.falling_states)
+        )
+        object.__setattr__(
+            self, "falling_elev_keys", tuple(-elev for elev in self.falling_elevs)
+        )
+        object.__setattr__(
+            self, "options", tuple(dict.fromkeys(self.rising_vals + self.falling_vals))
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Update:
     """Scheduled update."""
 
-    remove: CALLBACK_TYPE
     when: datetime
     state: str | None
     attrs: dict[str, Any] | None
@@ -827,37 +910,35 @@ class Sun2PhaseSensorBase(Sun2CPSensorEntity[str]):
         phase_data: PhaseData,
     ) -> None:
         """Initialize sensor."""
-        options = [state[1] for state in phase_data.rising_states]
-        for state in phase_data.falling_states:
-            if state[1] not in options:
-                options.append(state[1])
         entity_description = SensorEntityDescription(
             key=sensor_type,
             device_class=SensorDeviceClass.ENUM,
             icon=icon,
-            options=options,
+            options=list(phase_data.options),
         )
         super().__init__(sun2_entity_params, entity_description)
         self._d = phase_data
-        self._updates: list[Update] = []
+        self._updates: deque[Update] = deque()
 
     def _state_at_elev(self, elev: Num) -> str:
         """Return state at elevation."""
         assert self._cp
 
         if self._cp.rising:
-            return list(filter(lambda x: elev >= x[0], self._d.rising_states))[-1][1]
-        return list(filter(lambda x: elev <= x[0], self._d.falling_states))[-1][1]
+            return self._d.rising_vals[bisect_right(self._d.rising_keys, elev) - 1]
+        return self._d.falling_vals[bisect_right(self._d.falling_keys, -elev) - 1]
 
     @callback
     def _async_do_update(self, now: datetime) -> None:
         """Update entity from scheduled update."""
-        update = self._updates.pop(0)
+        self._unsub_update = None
+        update = self._updates.popleft()
         if self._updates:
             self._attr_native_value = update.state
             assert update.attrs is not None
             self._set_attrs(update.attrs, self._updates[0].when)
             self.async_write_ha_state()
+            self._schedule_next_update()
         else:
             # The last one means it's time to determine the next set of scheduled
             # updates.
@@ -869,21 +950,32 @@ class Sun2PhaseSensorBase(Sun2CPSensorEntity[str]):
         state: str | None = None,
         attrs: dict[str, Any] | None = None,
     ) -> None:
-        """Setu up update at given time."""
-        self._updates.append(
-            Update(
-                async_track_point_in_utc_time(
-                    self.hass, self._async_do_update, update_dttm
-                ),
-                update_dttm,
-                state,
-                attrs,
-            )
+        """Set up update at given time.
+
+        Updates must be set up in chronological order.
+        """
+        self._updates.append(Update(update_dttm, state, attrs))
+
+    def _schedule_next_update(self) -> None:
+        """Schedule the first pending update.
+
+        Only one timer is used at a time. Each update schedules the next one.
+        """
+        self._unsub_update = async_track_point_in_utc_time(
+            self.hass, self._async_do_update, self._updates[0].when
         )
 
-    def _setup_update_at_elev(self, elev: Num) -> None:
-        """Set up update when sun reaches given elevation."""
-        assert self._cp
+    def _setup_update_at_elev(self, elev: Num, lo_dttm: datetime) -> datetime | None:
+        """Set up update when sun reaches given elevation.
+
+        lo_dttm is the earliest time the sun could reach the elevation, e.g., when it
+        reached the previous elevation on this portion of the curve.
+        """
+        cp = self._cp
+        assert cp
+
+        mid_date = cp.mid_date
+        direction = _DIRECTIONS[cp.rising]
 
         # Try to find a close approximation for when the sun will reach the given
         # elevation. This should allow _get_dttm_at_elev to converge more quickly.
@@ -896,29 +988,25 @@ class Sun2PhaseSensorBase(Sun2CPSensorEntity[str]):
                 and can sometimes return None, especially near solar noon or solar
                 midnight.
                 """
-                assert self._cp
-
                 return nearest_second(
                     cast(
                         datetime,
                         self._astral_event(
-                            self._cp.mid_date + offset if offset else self._cp.mid_date,
+                            mid_date + offset if offset else mid_date,
                             "time_at_elevation",
                             False,
                             elevation=elev,
-                            direction=SunDirection.RISING
-                            if self._cp.rising
-                            else SunDirection.SETTING,
+                            direction=direction,
                         ),
                     )
                 )
 
             est_dttm = get_est_dttm()
-            if not self._cp.tl_dttm <= est_dttm < self._cp.tr_dttm:
+            if not cp.tl_dttm <= est_dttm < cp.tr_dttm:
                 est_dttm = get_est_dttm(
-                    ONE_DAY if est_dttm < self._cp.tl_dttm else -ONE_DAY
+                    ONE_DAY if est_dttm < cp.tl_dttm else -ONE_DAY
                 )
-                if not self._cp.tl_dttm <= est_dttm < self._cp.tr_dttm:
+                if not cp.tl_dttm <= est_dttm < cp.tr_dttm:
                     raise ValueError  # noqa: TRY301
         except (AttributeError, TypeError, ValueError) as exc:
             if not isinstance(exc, ValueError):
@@ -934,11 +1022,14 @@ class Sun2PhaseSensorBase(Sun2CPSensorEntity[str]):
                     elev,
                     self._as_tz(est_dttm),
                 )
-            t0_dttm = self._cp.tl_dttm
-            t1_dttm = self._cp.tr_dttm
+            t0_dttm = lo_dttm
+            t1_dttm = cp.tr_dttm
         else:
-            t0_dttm = max(est_dttm - _DELTA, self._cp.tl_dttm)
-            t1_dttm = min(est_dttm + _DELTA, self._cp.tr_dttm)
+            t0_dttm = max(est_dttm - _DELTA, lo_dttm)
+            t1_dttm = min(est_dttm + _DELTA, cp.tr_dttm)
+            if t0_dttm >= t1_dttm:
+                t0_dttm = lo_dttm
+                t1_dttm = cp.tr_dttm
         update_dttm = self._get_dttm_at_elev(t0_dttm, t1_dttm, elev, MAX_ERR_PHASE)
         if update_dttm:
             self._setup_update_at_time(
@@ -946,25 +1037,35 @@ class Sun2PhaseSensorBase(Sun2CPSensorEntity[str]):
             )
         elif self.hass.state == CoreState.running:
             LOGGER.error("%s: Failed to find the time at elev: %0.3f", self.name, elev)
+        return update_dttm
 
     def _setup_updates(self, cur_dttm: datetime, cur_elev: Num) -> None:
         """Set up updates for next portion of elevation curve."""
-        assert self._cp
-
-        if self._cp.rising:
-            for elev in self._d.rising_elevs:
-                if cur_elev < elev < self._cp.tr_elev:
-                    self._setup_update_at_elev(elev)
+        cp = self._cp
+        assert cp
+
+        # Elevations are sorted, so find the slice of them that falls between the
+        # current elevation and the elevation at the end of this portion of the
+        # curve (exclusive.)
+        if cp.rising:
+            elevs = self._d.rising_elevs
+            start = bisect_right(elevs, cur_elev)
+            stop = bisect_left(elevs, cp.tr_elev)
         else:
-            for elev in self._d.falling_elevs:
-                if cur_elev > elev > self._cp.tr_elev:
-                    self._setup_update_at_elev(elev)
+            elevs = self._d.falling_elevs
+            start = bisect_right(self._d.falling_elev_keys, -cur_elev)
+            stop = bisect_left(self._d.falling_elev_keys, -cp.tr_elev)
+        # Elevation is monotonic on this portion of the curve, so each elevation is
+        # reached after the previous one, which narrows the search for the next.
+        lo_dttm = cp.tl_dttm
+        for elev in elevs[start:stop]:
+            if update_dttm := self._setup_update_at_elev(elev, lo_dttm):
+                lo_dttm = update_dttm
 
     def _cancel_update(self) -> None:
         """Cancel pending updates."""
-        for update in self._updates:
-            update.remove()
-        self._updates = []
+        super()._cancel_update()
+        self._updates.clear()
 
     def _update(self, cur_dttm: datetime) -> None:
         """Update state."""
@@ -976,7 +1077,9 @@ class Sun2PhaseSensorBase(Sun2CPSensorEntity[str]):
         if self._updates:
             return
 
-        start_update = dt_util.utcnow()
+        # Only time the update if it will be logged.
+        if debug := LOGGER.isEnabledFor(logging.DEBUG):
+            start_update = dt_util.utcnow()
 
         # Astral package ignores microseconds, so round to nearest second
         # before continuing.
@@ -992,13 +1095,47 @@ class Sun2PhaseSensorBase(Sun2CPSensorEntity[str]):
         # method run again to create a new schedule of udpates. Therefore we do not
         # need to provide state and attribute values.
         self._setup_update_at_time(self._cp.tr_dttm)
+        self._schedule_next_update()
 
         # _setup_updates may have already determined the state.
         if not self._attr_native_value:
             self._attr_native_value = self._state_at_elev(cur_elev)
         self._set_attrs(self._attrs_at_elev(cur_elev), self._updates[0].when)
 
-        LOGGER.debug("%s: _update time: %s", self.name, dt_util.utcnow() - start_update)
+        if debug:
+            LOGGER.debug(
+                "%s: _update time: %s", self.name, dt_util.utcnow() - start_update
+            )
+
+
+def _sun_phase_data() -> PhaseData:
+    """Return phase data for Sun2PhaseSensor."""
+    phases = (
+        (-90, "night"),
+        (-18, "astronomical_twilight"),
+        (-12, "nautical_twilight"),
+        (-6, "civil_twilight"),
+        (SUNSET_ELEV, "day"),
+        (90, None),
+    )
+    elevs, states = cast(
+        tuple[tuple[Num], tuple[str | None]],
+        zip(*phases, strict=True),
+    )
+    rising_elevs = tuple(sorted([*elevs[1:-1], -4, 6]))
+    rising_states = cast(tuple[tuple[Num, str], ...], phases[:-1])
+    falling_elevs = rising_elevs[::-1]
+    falling_states = tuple(
+        cast(
+            tuple[tuple[Num, str]],
+            zip(elevs[1:], states[:-1], strict=True),
+        )
+    )[::-1]
+    return PhaseData(rising_elevs, rising_states, falling_elevs, falling_states)
+
+
+# Phase data is static, so create it once & share it with all instances.
+_SUN_PHASE_DATA = _sun_phase_data()
 
 
 class Sun2PhaseSensor(Sun2PhaseSensorBase):
@@ -1008,33 +1145,7 @@ class Sun2PhaseSensor(Sun2PhaseSensorBase):
         self, sun2_entity_params: Sun2EntityParams, sensor_type: str, icon: str | None
     ) -> None:
         """Initialize sensor."""
-        phases = (
-            (-90, "night"),
-            (-18, "astronomical_twilight"),
-            (-12, "nautical_twilight"),
-            (-6, "civil_twilight"),
-            (SUNSET_ELEV, "day"),
-            (90, None),
-        )
-        elevs, states = cast(
-            tuple[tuple[Num], tuple[str | None]],
-            zip(*phases, strict=True),
-        )
-        rising_elevs = sorted([*elevs[1:-1], -4, 6])
-        rising_states = phases[:-1]
-        falling_elevs = rising_elevs[::-1]
-        falling_states = tuple(
-            cast(
-                tuple[tuple[Num, str]],
-                zip(elevs[1:], states[:-1], strict=True),
-            )
-        )[::-1]
-        super().__init__(
-            sun2_entity_params,
-            sensor_type,
-            icon,
-            PhaseData(rising_elevs, rising_states, falling_elevs, falling_states),
-        )
+        super().__init__(sun2_entity_params, sensor_type, icon, _SUN_PHASE_DATA)
 
     def _attrs_at_elev(self, elev: Num) -> dict[str, Any]:
         """Return attributes at elevation."""
@@ -1053,6 +1164,42 @@ class Sun2PhaseSensor(Sun2PhaseSensorBase):
         return attrs
 
 
+def _deconz_phase_data() -> PhaseData:
+    """Return phase data for Sun2DeconzDaylightSensor."""
+    phases = (
+        (-90, "nadir", None),
+        (-18, "night_end", "night_start"),
+        (-12, "nautical_dawn", "nautical_dusk"),
+        (-6, "dawn", "dusk"),
+        (SUNSET_ELEV, "sunrise_start", "sunset_end"),
+        (-0.3, "sunrise_end", "sunset_start"),
+        (6, "golden_hour_1", "golden_hour_2"),
+        (90, None, "solar_noon"),
+    )
+    elevs, r_states, f_states = cast(
+        tuple[tuple[Num], tuple[str | None], tuple[str | None]],
+        zip(*phases, strict=True),
+    )
+    rising_elevs = elevs[1:-1]
+    rising_states = tuple(
+        cast(
+            tuple[tuple[Num, str]],
+            zip(elevs[:-1], r_states[:-1], strict=True),
+        )
+    )
+    falling_elevs = rising_elevs[::-1]
+    falling_states = tuple(
+        cast(
+            tuple[tuple[Num, str]],
+            zip(elevs[1:], f_states[1:], strict=True),
+        )
+    )[::-1]
+    return PhaseData(rising_elevs, rising_states, falling_elevs, falling_states)
+
+
+_DECONZ_PHASE_DATA = _deconz_phase_data()
+
+
 class Sun2DeconzDaylightSensor(Sun2PhaseSensorBase):
     """Sun2 deCONZ Phase Sensor."""
 
@@ -1060,59 +1207,25 @@ class Sun2DeconzDaylightSensor(Sun2PhaseSensorBase):
         self, sun2_entity_params: Sun2EntityParams, sensor_type: str, icon: str | None
     ) -> None:
         """Initialize sensor."""
-        phases = (
-            (-90, "nadir", None),
-            (-18, "night_end", "night_start"),
-            (-12, "nautical_dawn", "nautical_dusk"),
-            (-6, "dawn", "dusk"),
-            (SUNSET_ELEV, "sunrise_start", "sunset_end"),
-            (-0.3, "sunrise_end", "sunset_start"),
-            (6, "golden_hour_1", "golden_hour_2"),
-            (90, None, "solar_noon"),
-        )
-        elevs, r_states, f_states = cast(
-            tuple[tuple[Num], tuple[str | None], tuple[str | None]],
-            zip(*phases, strict=True),
-        )
-        rising_elevs = elevs[1:-1]
-        rising_states = tuple(
-            cast(
-                tuple[tuple[Num, str]],
-                zip(elevs[:-1], r_states[:-1], strict=True),
-            )
-        )
-        falling_elevs = rising_elevs[::-1]
-        falling_states = tuple(
-            cast(
-                tuple[tuple[Num, str]],
-                zip(elevs[1:], f_states[1:], strict=True),
-            )
-        )[::-1]
-        super().__init__(
-            sun2_entity_params,
-            sensor_type,
-            icon,
-            PhaseData(rising_elevs, rising_states, falling_elevs, falling_states),
-        )
+        super().__init__(sun2_entity_params, sensor_type, icon, _DECONZ_PHASE_DATA)
+        self._daylight: Callable[[Num, Num], bool] = ge
 
     def _attrs_at_elev(self, elev: Num) -> dict[str, Any]:
         """Return attributes at elevation."""
         assert self._cp
 
         attrs = super()._attrs_at_elev(elev)
-        if self._cp.rising:
-            daylight = elev >= SUNSET_ELEV
-        else:
-            daylight = elev > SUNSET_ELEV
-        attrs[ATTR_DAYLIGHT] = daylight
+        attrs[ATTR_DAYLIGHT] = self._daylight(elev, SUNSET_ELEV)
         return attrs
 
     def _setup_updates(self, cur_dttm: datetime, cur_elev: Num) -> None:
         """Set up updates for next portion of elevation curve."""
         assert self._cp
 
+        # When rising, sunset elevation is daylight. When falling, it is not.
+        self._daylight = ge if self._cp.rising else gt
+        nadir_dttm = self._cp.nadir_dttm
         if self._cp.rising:
-            nadir_dttm = self._cp.tr_dttm - HALF_DAY
             if cur_dttm < nadir_dttm:
                 self._attr_native_value = self._d.falling_states[-1][1]
                 nadir_elev = cast(float, self._astral_event(nadir_dttm))
@@ -1121,14 +1234,12 @@ class Sun2DeconzDaylightSensor(Sun2PhaseSensorBase):
                     self._d.rising_states[0][1],
                     self._attrs_at_elev(nadir_elev),
                 )
-        else:
-            nadir_dttm = self._cp.nxt_noon - HALF_DAY
-            if cur_dttm >= nadir_dttm:
-                self._attr_native_value = self._d.rising_states[0][1]
+        elif cur_dttm >= nadir_dttm:
+            self._attr_native_value = self._d.rising_states[0][1]
         super()._setup_updates(cur_dttm, cur_elev)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SensorParams:
     """Parameters for sensor types."""
 